@@ -1,6 +1,7 @@
 from rx import Observable
+import custom_operators
 
 Observable.from_(["Alpha","Beta","Gamma","Delta","Epsilon"]) \
-    .map(lambda s: len(s)) \
-    .filter(lambda i: i >= 5) \
+    .map_batch(lambda strings: [len(s) for s in strings]) \
+    .filter_batch(lambda lengths: [i for i in lengths if i >= 5]) \
     .subscribe(lambda value: print(value))
@@ -1,4 +1,5 @@
 from rx import Observable, Observer
+import custom_operators
 
 def push_numbers(observer):
     observer.on_next(100)
@@ -7,3 +8,15 @@ def push_numbers(observer):
     observer.on_completed()
 
 Observable.create(push_numbers).subscribe(on_next = lambda i: print(i))
+
+
+# if the values are already known, from_() can push them without a custom function
+# Observable.from_([100, 300, 500]).subscribe(on_next = lambda i: print(i))
+
+# values yielded by a generator function can be pushed with from_iterable_gen()
+# def generate_numbers():
+#     yield 100
+#     yield 300
+#     yield 500
+#
+# Observable.from_iterable_gen(generate_numbers).subscribe(on_next = lambda i: print(i))
@@ -1,16 +1,25 @@
 from rx import Observable
-import time
+from rx.concurrency import AsyncIOScheduler
+import asyncio
 
-disposable = Observable.interval(1000) \
+# run the timer on a single asyncio event loop rather than a timer thread
+loop = asyncio.new_event_loop()
+scheduler = AsyncIOScheduler(loop)
+
+disposable = Observable.interval(1000, scheduler=scheduler) \
     .map(lambda i: "{0} Mississippi".format(i)) \
     .subscribe(lambda s: print(s))
 
-# sleep 5 seconds so Observable can fire
-time.sleep(5)
 
 # disconnect the Subscriber
-print("Unsubscribing!")
-disposable.dispose()
+def unsubscribe():
+    print("Unsubscribing!")
+    disposable.dispose()
+
+# wait 5 seconds so Observable can fire, then unsubscribe
+loop.call_later(5, unsubscribe)
+
+# wait a bit longer to prove no more emissions are coming, then stop
+loop.call_later(10, loop.stop)
 
-# sleep a bit longer to prove no more emissions are coming
-time.sleep(5)
+loop.run_forever()
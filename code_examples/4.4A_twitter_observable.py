@@ -1,9 +1,14 @@
 from tweepy.streaming import StreamListener
 from tweepy import OAuthHandler
 from tweepy import Stream
-import json
 from rx import Observable
 
+# use the faster orjson parser when it is installed
+try:
+    import orjson as json
+except ImportError:
+    import json
+
 # Variables that contains the user credentials to access Twitter API
 access_token = "CONFIDENTIAL"
 access_token_secret = "CONFIDENTIAL"
@@ -34,7 +39,10 @@ def tweets_for(topics):
 
 topics = ['Britain','France']
 
-tweets_for(topics).map(lambda d: json.loads(d)) \
+# skip payloads without a "text" field (deletes, limits, etc) before paying to parse them
+tweets_for(topics) \
+    .filter(lambda d: ('"text"' if isinstance(d, str) else b'"text"') in d) \
+    .map(lambda d: json.loads(d)) \
     .filter(lambda map: "text" in map) \
     .map(lambda map: map["text"].strip()) \
     .subscribe(lambda s: print(s))
@@ -1,5 +1,6 @@
 from rx import Observable
+import custom_operators
 
 Observable.from_(["Alpha","Beta","Gamma","Delta","Epsilon"]) \
-    .filter(lambda s: len(s) >= 5) \
+    .filter_batch(lambda strings: [s for s in strings if len(s) >= 5]) \
     .subscribe(lambda s: print(s))
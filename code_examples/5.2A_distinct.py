@@ -1,6 +1,7 @@
 from rx import Observable
+import custom_operators
 
 Observable.from_(["Alpha", "Beta", "Gamma", "Delta", "Epsilon"]) \
     .map(lambda s: len(s)) \
-    .distinct() \
+    .distinct_fast() \
     .subscribe(lambda i: print(i))
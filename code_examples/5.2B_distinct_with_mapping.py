@@ -1,5 +1,6 @@
 from rx import Observable
+import custom_operators
 
 Observable.from_(["Alpha", "Beta", "Gamma", "Delta", "Epsilon"]) \
-    .distinct(lambda s: len(s)) \
+    .distinct_fast(lambda s: len(s)) \
     .subscribe(lambda i: print(i))
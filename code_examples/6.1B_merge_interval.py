@@ -1,11 +1,21 @@
 from rx import Observable
+from rx.concurrency import AsyncIOScheduler
+import asyncio
 
-source1 = Observable.interval(1000).map(lambda i: "Source 1: {0}".format(i))
-source2 = Observable.interval(500).map(lambda i: "Source 2: {0}".format(i))
-source3 = Observable.interval(300).map(lambda i: "Source 3: {0}".format(i))
+# all three intervals share one asyncio event loop rather than a thread each
+loop = asyncio.new_event_loop()
+scheduler = AsyncIOScheduler(loop)
+
+source1 = Observable.interval(1000, scheduler=scheduler).map(lambda i: f"Source 1: {i}")
+source2 = Observable.interval(500, scheduler=scheduler).map(lambda i: f"Source 2: {i}")
+source3 = Observable.interval(300, scheduler=scheduler).map(lambda i: f"Source 3: {i}")
 
 Observable.merge(source1, source2, source3) \
     .subscribe(lambda s: print(s))
 
-# keep application alive until user presses a key
-input("Press any key to quit\n")
+# keep application alive until user presses Ctrl+C
+print("Press Ctrl+C to quit")
+try:
+    loop.run_forever()
+except KeyboardInterrupt:
+    pass
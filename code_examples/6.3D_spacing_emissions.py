@@ -1,9 +1,9 @@
 from rx import Observable
 
 letters = Observable.from_(["Alpha","Beta","Gamma","Delta","Epsilon"])
-intervals = Observable.interval(1000)
 
-Observable.zip(letters,intervals, lambda s,i: s) \
+# wait one second before emitting each letter, one timer at a time
+letters.concat_map(lambda s: Observable.timer(1000).map(lambda i: s)) \
     .subscribe(lambda s: print(s))
 
 input("Press any key to quit\n")
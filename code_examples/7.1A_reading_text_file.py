@@ -1,12 +1,11 @@
 from rx import Observable
+from pathlib import Path
 
 
 def read_lines(file_name):
-    file = open(file_name)
-
-    return Observable.from_(file) \
-        .map(lambda l: l.strip()) \
-        .filter(lambda l: l != "")
+    # read the whole file at once and push a list of its cleaned up lines, so no file handle is left open
+    lines = (l.strip() for l in Path(file_name).read_text().splitlines())
+    return Observable.from_([l for l in lines if l != ""])
 
 
 read_lines("bbc_news_article.txt").subscribe(lambda s: print(s))
@@ -3,10 +3,12 @@ from urllib.request import urlopen
 
 
 def read_request(link):
-    f = urlopen(link)
+    # read and decode the whole response in one pass rather than decoding line by line
+    with urlopen(link) as f:
+        text = f.read().decode("utf-8")
 
-    return Observable.from_(f) \
-        .map(lambda s: s.decode("utf-8").strip()) \
+    lines = (l.strip() for l in text.splitlines())
+    return Observable.from_([l for l in lines if l != ""])
 
 read_request("https://goo.gl/rIaDyM") \
     .subscribe(lambda s: print(s))
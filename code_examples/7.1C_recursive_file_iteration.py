@@ -1,22 +1,66 @@
 from rx import Observable
+import mmap
 import os
 
 
 def recursive_files_in_directory(folder):
 
+    def txt_files_recursively(directory):
+        # os.scandir() gets the file type with each entry, so no extra stat() per file
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from txt_files_recursively(entry.path)
+                elif entry.name.endswith('.txt'):
+                    yield entry.path
+
     def emit_files_recursively(observer):
-        for root, directories, filenames in os.walk(folder):
-            for directory in directories:
-                observer.on_next(os.path.join(root, directory))
-            for filename in filenames:
-                observer.on_next(os.path.join(root, filename))
+        file_paths = txt_files_recursively(folder)
+
+        # only errors from walking the directories go to on_error, not errors raised downstream
+        while True:
+            try:
+                file_path = next(file_paths)
+            except StopIteration:
+                break
+            except OSError as e:
+                observer.on_error(e)
+                return
+            observer.on_next(file_path)
 
         observer.on_completed()
 
     return Observable.create(emit_files_recursively)
 
 
-recursive_files_in_directory('/home/thomas/Desktop/bbc_data_sets') \
-    .filter(lambda f: f.endswith('.txt')) \
-    .subscribe(on_next=lambda l: print(l), on_error=lambda e: print(e))
+def mmap_lines(file_name):
+    # memory-map the file and push its lines, decoding each one as it is read
+
+    def emit_lines(observer):
+        # a file that cannot be opened or mapped is pushed to on_error rather than raised
+        try:
+            with open(file_name, 'rb') as file:
+                # empty files cannot be memory-mapped
+                if os.fstat(file.fileno()).st_size == 0:
+                    mm = None
+                else:
+                    mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError as e:
+            observer.on_error(e)
+            return
+
+        if mm is not None:
+            with mm:
+                for line in iter(mm.readline, b""):
+                    observer.on_next(line.decode("ISO-8859-1"))
 
+        observer.on_completed()
+
+    return Observable.create(emit_lines)
+
+
+recursive_files_in_directory('/home/thomas/Desktop/bbc') \
+    .flat_map(lambda f: mmap_lines(f)) \
+    .map(lambda l: l.strip()) \
+    .filter(lambda l: l != "") \
+    .subscribe(on_next=lambda l: print(l), on_error=lambda e: print(e))
@@ -2,14 +2,16 @@ from sqlalchemy import create_engine, text
 from rx import Observable
 
 engine = create_engine('sqlite:///rexon_metals.db')
-conn = engine.connect()
+conn = engine.connect().execution_options(stream_results=True)
 
 
-def get_all_customers():
-    stmt = text("SELECT * FROM CUSTOMER")
-    return Observable.from_(conn.execute(stmt))
+def get_all_customer_ids():
+    # select only the needed column and fetch it from the database 1000 IDs at a time,
+    # then flatten each fetched batch so the IDs are emitted one by one
+    stmt = text("SELECT CUSTOMER_ID FROM CUSTOMER")
+    return Observable.from_(conn.execute(stmt).scalars().partitions(1000)) \
+        .flat_map(lambda ids: Observable.from_(ids))
 
 
-get_all_customers() \
-    .map(lambda r: r[0]) \
+get_all_customer_ids() \
     .subscribe(lambda r: print(r))
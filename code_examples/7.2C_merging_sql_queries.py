@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, create_engine, text
 from rx import Observable
 
 engine = create_engine('sqlite:///rexon_metals.db')
@@ -10,12 +10,15 @@ def get_all_customers():
     return Observable.from_(conn.execute(stmt))
 
 
-def customer_for_id(customer_id):
-    stmt = text("SELECT * FROM CUSTOMER WHERE CUSTOMER_ID = :id")
-    return Observable.from_(conn.execute(stmt, id=customer_id))
+def customers_for_ids(customer_ids):
+    # one query for all the IDs rather than one query per ID
+    stmt = text("SELECT * FROM CUSTOMER WHERE CUSTOMER_ID IN :ids") \
+        .bindparams(bindparam("ids", expanding=True))
+    return Observable.from_(conn.execute(stmt, ids=customer_ids))
 
 
 # Query customers with IDs 1, 3, and 5
 Observable.from_([1, 3, 5]) \
-    .flat_map(lambda id: customer_for_id(id)) \
+    .to_list() \
+    .flat_map(lambda ids: customers_for_ids(ids)) \
     .subscribe(lambda r: print(r))
@@ -16,14 +16,30 @@ def customer_for_id(customer_id):
     return Observable.from_(conn.execute(stmt, id=customer_id))
 
 
-def insert_new_customer(customer_name, region, street_address, city, state, zip_code):
-    stmt = text("INSERT INTO CUSTOMER (NAME, REGION, STREET_ADDRESS, CITY, STATE, ZIP) VALUES ("
-                ":customer_name, :region, :street_address, :city, :state, :zip_code)")
+insert_customer_stmt = text("INSERT INTO CUSTOMER (NAME, REGION, STREET_ADDRESS, CITY, STATE, ZIP) VALUES ("
+                            ":customer_name, :region, :street_address, :city, :state, :zip_code)")
+
 
-    result = conn.execute(stmt, customer_name=customer_name, region=region, street_address=street_address, city=city, state=state, zip_code=zip_code)
+def insert_new_customer(customer_name, region, street_address, city, state, zip_code):
+    result = conn.execute(insert_customer_stmt, customer_name=customer_name, region=region, street_address=street_address, city=city, state=state, zip_code=zip_code)
     return Observable.just(result.lastrowid)
 
+
+def insert_customers(customers, batch_size=500):
+    # buffer an Observable of customer dicts and insert each buffer with a single executemany() call,
+    # then emit the number of rows inserted for each batch
+    return customers \
+        .buffer_with_count(batch_size) \
+        .map(lambda batch: conn.execute(insert_customer_stmt, batch).rowcount)
+
 # Create new customer, emit primary key ID, and query that customer
 insert_new_customer('RMS Materials','Northeast', '5764 Carrier Ln', 'Boston', 'Massachusetts', '02201') \
     .flat_map(lambda i: customer_for_id(i)) \
     .subscribe(lambda s: print(s))
+
+# to insert many customers at once:
+# insert_customers(Observable.from_([
+#     {'customer_name': 'RMS Materials', 'region': 'Northeast', 'street_address': '5764 Carrier Ln',
+#      'city': 'Boston', 'state': 'Massachusetts', 'zip_code': '02201'},
+#     ...
+# ])).subscribe(lambda ct: print("Inserted {0} customers".format(ct)))
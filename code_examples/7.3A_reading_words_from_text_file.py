@@ -1,16 +1,15 @@
 from rx import Observable
 import re
 
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
 
 def words_from_file(file_name):
-    file = open(file_name)
+    with open(file_name) as file:
+        text = file.read()
 
-    # parse, clean, and push words in text file
-    return Observable.from_(file) \
-        .flat_map(lambda s: Observable.from_(s.split())) \
-        .map(lambda w: re.sub(r'[^\w]', '', w)) \
-        .filter(lambda w: w != "") \
-        .map(lambda w: w.lower())
+    # clean the whole text with one regex pass, then split and push its words
+    return Observable.from_(_NON_WORD_RE.sub("", text).lower().split())
 
 article_file = "bbc_news_article.txt"
 words_from_file(article_file).subscribe(lambda w: print(w))
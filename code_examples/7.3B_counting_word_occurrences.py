@@ -1,26 +1,22 @@
 from rx import Observable
 import re
+import custom_operators
 
+_NON_WORD_RE = re.compile(r"[^\w\s]")
 
-def words_from_file(file_name):
-    file = open(file_name)
 
-    # parse, clean, and push words in text file
-    return Observable.from_(file) \
-        .flat_map(lambda s: Observable.from_(s.split())) \
-        .map(lambda w: re.sub(r'[^\w\s]', '', w)) \
-        .filter(lambda w: w != "") \
-        .map(lambda w: w.lower()) \
+def words_from_file(file_name):
+    with open(file_name) as file:
+        text = file.read()
 
+    # clean the whole text with one regex pass, then split and push its words
+    return Observable.from_(_NON_WORD_RE.sub("", text).lower().split())
 
 
 def word_counter(file_name):
 
-    # count words using `group_by()`
-    # tuple the word with the count
-    return words_from_file(file_name) \
-        .group_by(lambda word: word) \
-        .flat_map(lambda grp: grp.count().map(lambda ct: (grp.key, ct)))
+    # count words into a single dict of word to count using `count_by()`
+    return words_from_file(file_name).count_by(lambda word: word)
 
 article_file = "bbc_news_article.txt"
 word_counter(article_file).subscribe(lambda w: print(w))
@@ -2,33 +2,45 @@
 # but only prints it as a dict if it has changed
 
 from rx import Observable
+import os
 import re
+import custom_operators
 
+_NON_WORD_RE = re.compile(r"[^\w\s]")
 
-def words_from_file(file_name):
-    file = open(file_name)
 
-    # parse, clean, and push words in text file
-    return Observable.from_(file) \
-        .flat_map(lambda s: Observable.from_(s.split())) \
-        .map(lambda w: re.sub(r'[^\w\s]', '', w)) \
-        .filter(lambda w: w != "") \
-        .map(lambda w: w.lower()) \
+def words_from_file(file_name):
+    with open(file_name) as file:
+        text = file.read()
 
+    # clean the whole text with one regex pass, then split and push its words
+    return Observable.from_(_NON_WORD_RE.sub("", text).lower().split())
 
 
 def word_counter(file_name):
 
-    # count words using `group_by()`
-    # tuple the word with the count
-    return words_from_file(file_name) \
-        .group_by(lambda word: word) \
-        .flat_map(lambda grp: grp.count().map(lambda ct: (grp.key, ct)))
+    # count words into a single dict of word to count using `count_by()`
+    # and tuple it with a fingerprint of the counts
+    return words_from_file(file_name).count_by(lambda word: word, with_fingerprint=True)
+
+
+# remembers the last word count for each file with the modification time and size it was counted at
+word_counts_by_file = {}
+
+
+# wraps the above word_counter() so the file is only re-read and re-counted when it has been edited
+def cached_word_counter(file_name):
+    stat = os.stat(file_name)
+    file_version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = word_counts_by_file.get(file_name)
+    if cached is not None and cached[0] == file_version:
+        return Observable.just(cached[1])
 
+    def cache_result(result):
+        word_counts_by_file[file_name] = (file_version, result)
 
-# composes the above word_counter() into a dict
-def word_counter_as_dict(file_name):
-    return word_counter(file_name).to_dict(lambda t: t[0], lambda t: t[1])
+    return word_counter(file_name).do_action(cache_result)
 
 
 # Schedule to create a word count dict every three seconds an article
@@ -36,11 +48,11 @@ def word_counter_as_dict(file_name):
 
 article_file = "bbc_news_article.txt"
 
-# create a dict every three seconds, but only push if it changed
+# create a dict every three seconds, but only push if its fingerprint changed
 Observable.interval(3000) \
-    .flat_map(lambda i: word_counter_as_dict(article_file))
-    .distinct_until_changed() \
-    .subscribe(lambda word_ct_dict: print(word_ct_dict))
+    .flat_map(lambda i: cached_word_counter(article_file)) \
+    .distinct_until_changed(lambda fingerprint_and_dict: fingerprint_and_dict[0]) \
+    .subscribe(lambda fingerprint_and_dict: print(fingerprint_and_dict[1]))
 
 # Keep alive until user presses any key
 input("Starting, press any key to quit\n")
@@ -2,7 +2,7 @@ from rx import Observable
 
 source = Observable.from_(["Alpha","Beta","Gamma","Delta","Epsilon"]).publish()
 
-source.subscribe(lambda s: print("Subscriber 1: {0}".format(s)))
-source.subscribe(lambda s: print("Subscriber 2: {0}".format(s)))
+source.subscribe(lambda s: print(f"Subscriber 1: {s}"))
+source.subscribe(lambda s: print(f"Subscriber 2: {s}"))
 
 source.connect()
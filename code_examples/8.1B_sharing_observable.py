@@ -3,11 +3,11 @@ import time
 
 source = Observable.interval(1000).publish()
 
-source.subscribe(lambda s: print("Subscriber 1: {0}".format(s)))
+source.subscribe(lambda s: print(f"Subscriber 1: {s}"))
 source.connect()
 
 # sleep 5 seconds, then add another subscriber
 time.sleep(5)
-source.subscribe(lambda s: print("Subscriber 2: {0}".format(s)))
+source.subscribe(lambda s: print(f"Subscriber 2: {s}"))
 
 input("Press any key to exit\n")
\ No newline at end of file
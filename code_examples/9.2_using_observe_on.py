@@ -1,11 +1,23 @@
 from rx import Observable
 from rx.concurrency import ThreadPoolScheduler
 from threading import current_thread
-import multiprocessing, time, random
+from numba import njit
+import multiprocessing, math, random
+
+@njit(nogil=True, cache=True)
+def busy_loop(iterations):
+    # placeholder numeric kernel, swap in your own CPU-bound math here
+    total = 0.0
+    for i in range(iterations):
+        total += math.sqrt(i)
+    return total
+
 
 def intense_calculation(value):
-    # sleep for a random short duration between 0.5 to 2.0 seconds to simulate a long-running calculation
-    time.sleep(random.randint(5,20) * .1)
+    # spin the compiled kernel for a random number of iterations to simulate a long-running calculation,
+    # this is an amount of work rather than a duration, so how long it takes depends on the machine
+    # nogil=True releases the GIL, so work scheduled on pool_scheduler truly runs in parallel across cores
+    busy_loop(random.randint(5,20) * 40000000)
     return value
 
 # calculate number of CPU's and add 1, then create a ThreadPoolScheduler with that number of threads
@@ -16,21 +28,22 @@ pool_scheduler = ThreadPoolScheduler(optimal_thread_count)
 Observable.from_(["Alpha","Beta","Gamma","Delta","Epsilon"]) \
     .map(lambda s: intense_calculation(s)) \
     .subscribe_on(pool_scheduler) \
-    .subscribe(on_next=lambda s: print("PROCESS 1: {0} {1}".format(current_thread().name, s)),
+    .subscribe(on_next=lambda s: print(f"PROCESS 1: {current_thread().name} {s}"),
                on_error=lambda e: print(e),
               on_completed=lambda: print("PROCESS 1 done!"))
 
-# Create Process 2
+# Create Process 2, giving each value its own subscribe_on() so the calculations run in parallel
 Observable.range(1,10) \
-    .map(lambda s: intense_calculation(s)) \
-    .subscribe_on(pool_scheduler) \
-    .subscribe(on_next=lambda i: print("PROCESS 2: {0} {1}".format(current_thread().name, i)), on_error=lambda e: print(e), on_completed=lambda: print("PROCESS 2 done!"))
+    .flat_map(lambda i:
+        Observable.just(i).subscribe_on(pool_scheduler).map(lambda i: intense_calculation(i))
+    ) \
+    .subscribe(on_next=lambda i: print(f"PROCESS 2: {current_thread().name} {i}"), on_error=lambda e: print(e), on_completed=lambda: print("PROCESS 2 done!"))
 
 # Create Process 3, which is infinite
 Observable.interval(1000) \
     .map(lambda i: i * 100) \
     .observe_on(pool_scheduler) \
     .map(lambda s: intense_calculation(s)) \
-    .subscribe(on_next=lambda i: print("PROCESS 3: {0} {1}".format(current_thread().name, i)), on_error=lambda e: print(e))
+    .subscribe(on_next=lambda i: print(f"PROCESS 3: {current_thread().name} {i}"), on_error=lambda e: print(e))
 
 input("Press any key to exit\n")
\ No newline at end of file
@@ -1,12 +1,24 @@
 from rx import Observable
 from rx.concurrency import ThreadPoolScheduler
 from threading import current_thread
-import multiprocessing, time, random
+from numba import njit
+import multiprocessing, math, random
+
+
+@njit(nogil=True, cache=True)
+def busy_loop(iterations):
+    # placeholder numeric kernel, swap in your own CPU-bound math here
+    total = 0.0
+    for i in range(iterations):
+        total += math.sqrt(i)
+    return total
 
 
 def intense_calculation(value):
-    # sleep for a random short duration between 0.5 to 2.0 seconds to simulate a long-running calculation
-    time.sleep(random.randint(5,20) * .1)
+    # spin the compiled kernel for a random number of iterations to simulate a long-running calculation,
+    # this is an amount of work rather than a duration, so how long it takes depends on the machine
+    # nogil=True releases the GIL, so work scheduled on pool_scheduler truly runs in parallel across cores
+    busy_loop(random.randint(5,20) * 40000000)
     return value
 
 # calculate number of CPU's and add 1, then create a ThreadPoolScheduler with that number of threads
@@ -18,7 +30,7 @@ Observable.from_(["Alpha","Beta","Gamma","Delta","Epsilon","Zeta","Eta","Theta",
     .flat_map(lambda s:
         Observable.just(s).subscribe_on(pool_scheduler).map(lambda s: intense_calculation(s))
     ) \
-    .subscribe(on_next=lambda i: print("{0} {1}".format(current_thread().name, i)),
+    .subscribe(on_next=lambda i: print(f"{current_thread().name} {i}"),
                on_error=lambda e: print(e),
                on_completed=lambda: print("PROCESS 1 done!"))
 
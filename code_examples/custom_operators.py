@@ -0,0 +1,155 @@
+from collections import Counter
+
+from rx import Observable
+from rx.concurrency import current_thread_scheduler
+from rx.disposables import SingleAssignmentDisposable
+from rx.internal import extensionclassmethod, extensionmethod
+
+# Importing this module adds the custom operators below to `Observable`,
+# the same way RxPy adds its own ~130 operators at runtime.
+
+
+@extensionmethod(Observable)
+def map_batch(self, mapper, batch_size=1024):
+    # buffer emissions into lists of up to `batch_size`, hand each list to `mapper` in one call,
+    # then push the items of the returned list downstream one at a time
+    # a batch is only flushed when it is full or the source completes, so this is meant for finite sources,
+    # for slow or infinite sources use buffer_with_time_or_count() so partial batches still get flushed
+    source = self
+
+    def subscribe(observer):
+        buffer = []
+        subscription = SingleAssignmentDisposable()
+
+        def flush():
+            batch = buffer[:]
+            del buffer[:]
+            try:
+                results = mapper(batch)
+            except Exception as e:
+                subscription.dispose()
+                observer.on_error(e)
+                return
+
+            on_next = observer.on_next
+            for result in results:
+                on_next(result)
+
+        def on_next(value):
+            buffer.append(value)
+            if len(buffer) >= batch_size:
+                flush()
+
+        def on_completed():
+            if buffer:
+                flush()
+            observer.on_completed()
+
+        subscription.disposable = source.subscribe(on_next, observer.on_error, on_completed)
+        return subscription
+
+    return Observable.create(subscribe)
+
+
+@extensionmethod(Observable)
+def filter_batch(self, predicate, batch_size=1024):
+    # `predicate` receives a list of emissions and returns the list of emissions to keep
+    # this is map_batch() under another name, so nothing stops `predicate` from transforming items too
+    return self.map_batch(predicate, batch_size)
+
+
+@extensionmethod(Observable)
+def count_by(self, key_mapper, with_fingerprint=False):
+    # count emissions per key into a single Counter and emit it as a dict once the source completes
+    # with_fingerprint=True emits a (fingerprint, dict) tuple instead, where the fingerprint is an
+    # order-independent hash of the counts kept up to date on every increment, so two results
+    # can be compared with one integer comparison rather than a full dict comparison
+    source = self
+
+    def subscribe(observer):
+        counts = Counter()
+        fingerprint = [0]
+        subscription = SingleAssignmentDisposable()
+
+        def on_next(value):
+            try:
+                key = key_mapper(value)
+            except Exception as e:
+                subscription.dispose()
+                observer.on_error(e)
+                return
+            count = counts[key]
+            counts[key] = count + 1
+            if with_fingerprint:
+                if count:
+                    fingerprint[0] ^= hash((key, count))
+                fingerprint[0] ^= hash((key, count + 1))
+
+        def on_completed():
+            if with_fingerprint:
+                observer.on_next((fingerprint[0], dict(counts)))
+            else:
+                observer.on_next(dict(counts))
+            observer.on_completed()
+
+        subscription.disposable = source.subscribe(on_next, observer.on_error, on_completed)
+        return subscription
+
+    return Observable.create(subscribe)
+
+
+@extensionmethod(Observable)
+def distinct_fast(self, key_mapper=None):
+    # like distinct(), but tracks seen keys in a plain set with its methods bound up front
+    source = self
+
+    def subscribe(observer):
+        seen = set()
+        add = seen.add
+        on_next_downstream = observer.on_next
+        subscription = SingleAssignmentDisposable()
+
+        def on_next(value):
+            try:
+                key = value if key_mapper is None else key_mapper(value)
+            except Exception as e:
+                subscription.dispose()
+                observer.on_error(e)
+                return
+            if key not in seen:
+                add(key)
+                on_next_downstream(value)
+
+        subscription.disposable = source.subscribe(on_next, observer.on_error, observer.on_completed)
+        return subscription
+
+    return Observable.create(subscribe)
+
+
+@extensionclassmethod(Observable)
+def from_iterable_gen(cls, generator_function, scheduler=None):
+    # like create(), but pushes whatever a fresh `generator_function()` yields to each subscriber
+    # values are pulled one at a time on the scheduler, the same way from_() iterates, so iteration
+    # stops as soon as the subscriber disposes, and only errors raised by the generator go to on_error
+    scheduler = scheduler or current_thread_scheduler
+
+    def subscribe(observer):
+        iterator = generator_function()
+        on_next = observer.on_next
+
+        def action(action1, state=None):
+            try:
+                value = next(iterator)
+            except StopIteration:
+                observer.on_completed()
+                return
+            except Exception as e:
+                observer.on_error(e)
+                return
+
+            on_next(value)
+            action1(action)
+
+        return scheduler.schedule_recursive(action)
+
+    return Observable.create(subscribe)